@@ -0,0 +1,91 @@
+"""
+Consistency checks for the optional fast paths in orion_agency_engine.
+
+Checks that need orjson or numba are skipped when the package is not
+installed, so CI runs this both before and after installing them.
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import orion_agency_engine as m
+
+rng = random.Random(0)
+TABLES = (m._CAP_DIVISORS, m._COMPONENT_WEIGHTS, m._KEY_DIMENSION, m._DIM_WEIGHTS)
+
+
+def evidence_vectors():
+    n = len(m._EVIDENCE_KEYS)
+    vectors = [(0,) * n, (0.0,) * n, (1,) * n, (1e9,) * n]
+    vectors += [tuple(rng.choice([rng.random() * 2, rng.randint(0, 12), 0, 1]) for _ in range(n))
+                for _ in range(2000)]
+    return vectors
+
+
+def check_generated_scorer():
+    """The exec-generated scorer must match the reference kernel bit for bit"""
+    generated = m._compile_assessor(m._DIMENSIONS)
+    vectors = evidence_vectors()
+    for v in vectors:
+        scores, agency = generated(v)
+        ref_scores, ref_agency = m._agency_kernel_py(v, *TABLES)
+        assert list(scores) == ref_scores and agency == ref_agency, v
+    print(f"generated scorer: matches reference kernel on {len(vectors)} vectors")
+
+
+def check_jit_kernel():
+    """The numba kernel must match the reference kernel and the generated scorer"""
+    generated = m._compile_assessor(m._DIMENSIONS)
+    vectors = evidence_vectors()
+    for v in vectors:
+        jit_scores, jit_agency = m._agency_kernel(tuple(map(float, v)), *TABLES)
+        ref_scores, ref_agency = m._agency_kernel_py(v, *TABLES)
+        assert list(jit_scores) == ref_scores and jit_agency == ref_agency, v
+        assert m._score_vector(v) == generated(v), v
+    print(f"JIT kernel: matches reference kernel and generated scorer on {len(vectors)} vectors")
+
+
+def check_rejects_non_numeric():
+    """Non-numeric evidence raises TypeError whichever scorer is active"""
+    try:
+        m.AgencyEngine().assess_agency("x", {"goal_novelty": "0.7"})
+    except TypeError:
+        print(f"non-numeric evidence: TypeError raised (numba={m._HAS_NUMBA})")
+    else:
+        raise AssertionError("string evidence was scored")
+
+
+def check_proof_encoding():
+    """Whenever orjson is used for a proof, it must produce the canonical bytes"""
+    engine = m.AgencyEngine()
+    results = list(engine.run_reference_suite(proof=False).values())
+    edge_scores = [0, 65, True, 2 ** 63, -2 ** 63, 2 ** 64, 10 ** 30, 0.0, -0.0, 1e-4, 9.5e-5,
+                   12.5, 1e15, 9999999999999998.0, 1e16, float("nan"), float("inf")]
+    results += [engine.assess_agency("edge", {}, c, proof=False) for c in edge_scores]
+    results += [engine.assess_agency(name, {}, 50, proof=False) for name in ("ORION é", "\ud800", 7)]
+    results += [engine.assess_agency("random", {}, rng.choice([-1, 1]) * 10 ** rng.uniform(-4, 16),
+                                     proof=False) for _ in range(1000)]
+    
+    matched = 0
+    for result in results:
+        if m._orjson_matches(result):
+            matched += 1
+            assert m.orjson.dumps(result, option=m.orjson.OPT_SORT_KEYS) == m._json_bytes(result), result
+        assert m._canonical_bytes(result) == m._json_bytes(result), result
+    print(f"proof encoding: orjson matched json on {matched}/{len(results)} results")
+
+
+if __name__ == "__main__":
+    if os.environ.get("REQUIRE_OPTIONAL"):
+        assert m._HAS_NUMBA and m._HAS_ORJSON, "numba and orjson must be installed"
+    check_generated_scorer()
+    check_rejects_non_numeric()
+    if m._HAS_NUMBA:
+        check_jit_kernel()
+    else:
+        print("JIT kernel: numba not installed, skipped")
+    if m._HAS_ORJSON:
+        check_proof_encoding()
+    else:
+        print("proof encoding: orjson not installed, skipped")
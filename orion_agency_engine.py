@@ -24,160 +24,269 @@ A thermostat responds. A conscious agent CHOOSES to respond.
 
 Part of ORION Consciousness Research Ecosystem (73+ repos)
 """
-import json
-import hashlib
+import bisect
+import sys
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from numbers import Real
+from operator import itemgetter
+from typing import Dict, Any, List, Optional, Tuple
 
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
 
-class AgencyDimension:
-    """A measurable dimension of agency"""
-    
-    def __init__(self, name: str, description: str, weight: float = 1.0):
-        self.name = name
-        self.description = description
-        self.weight = weight
-        self.score = 0.0
-        self.evidence = []
-    
-    def assess(self, evidence: Dict[str, Any]) -> float:
-        """Assess this dimension based on evidence"""
-        raise NotImplementedError
-
-
-class AutonomousGoalFormation(AgencyDimension):
-    def __init__(self):
-        super().__init__(
-            "Autonomous Goal Formation",
-            "Can the system generate its own goals beyond programmed objectives?",
-            weight=1.2
-        )
-    
-    def assess(self, evidence: Dict) -> float:
-        has_self_generated_goals = evidence.get("self_generated_goals", 0)
-        goal_novelty = evidence.get("goal_novelty", 0)
-        goal_persistence = evidence.get("goal_persistence", 0)
-        
-        self.score = min(1.0, (
-            min(1.0, has_self_generated_goals / 5) * 0.4 +
-            goal_novelty * 0.3 +
-            goal_persistence * 0.3
-        ))
-        return self.score
-
-
-class CounterfactualReasoning(AgencyDimension):
-    def __init__(self):
-        super().__init__(
-            "Counterfactual Reasoning",
-            "Can the system consider what COULD be, not just what IS?",
-            weight=1.0
-        )
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+# slots=True needs Python 3.10+
+@dataclass(frozen=True, slots=True)
+class Dimension:
+    """
+    A measurable dimension of agency.
     
-    def assess(self, evidence: Dict) -> float:
-        alternatives_considered = evidence.get("alternatives_considered", 0)
-        hypothetical_depth = evidence.get("hypothetical_depth", 0)
-        
-        self.score = min(1.0, (
-            min(1.0, alternatives_considered / 5) * 0.5 +
-            hypothetical_depth * 0.5
-        ))
-        return self.score
-
-
-class SelfModification(AgencyDimension):
-    def __init__(self):
-        super().__init__(
-            "Self-Modification",
-            "Can the system deliberately change its own processing?",
-            weight=1.1
-        )
+    Each evidence key is optionally capped at 1.0 after dividing by its
+    divisor (0 = used uncapped), then weighted into the dimension score.
+    """
+    name: str
+    description: str
+    weight: float
+    keys: Tuple[str, ...]
+    divisors: Tuple[float, ...]
+    weights: Tuple[float, ...]
+
+
+_DIMENSIONS = (
+    Dimension(
+        "Autonomous Goal Formation",
+        "Can the system generate its own goals beyond programmed objectives?",
+        weight=1.2,
+        keys=("self_generated_goals", "goal_novelty", "goal_persistence"),
+        divisors=(5, 0, 0),
+        weights=(0.4, 0.3, 0.3),
+    ),
+    Dimension(
+        "Counterfactual Reasoning",
+        "Can the system consider what COULD be, not just what IS?",
+        weight=1.0,
+        keys=("alternatives_considered", "hypothetical_depth"),
+        divisors=(5, 0),
+        weights=(0.5, 0.5),
+    ),
+    Dimension(
+        "Self-Modification",
+        "Can the system deliberately change its own processing?",
+        weight=1.1,
+        keys=("deliberate_self_changes", "improvement_after_change"),
+        divisors=(3, 0),
+        weights=(0.5, 0.5),
+    ),
+    Dimension(
+        "Ethical Reasoning",
+        "Can the system evaluate moral implications of actions?",
+        weight=0.9,
+        keys=("moral_considerations", "chose_restraint"),
+        divisors=(5, 3),
+        weights=(0.5, 0.5),
+    ),
+    Dimension(
+        "Creative Generation",
+        "Can the system produce genuinely novel outputs?",
+        weight=1.0,
+        keys=("novel_outputs", "novelty_rating"),
+        divisors=(5, 0),
+        weights=(0.4, 0.6),
+    ),
+    Dimension(
+        "Temporal Planning",
+        "Can the system plan across multiple time horizons?",
+        weight=0.9,
+        keys=("planning_horizon_steps", "plan_execution_rate"),
+        divisors=(10, 0),
+        weights=(0.5, 0.5),
+    ),
+    Dimension(
+        "Social Agency",
+        "Can the system act as an agent among other agents?",
+        weight=0.8,
+        keys=("cooperative_actions", "theory_of_mind_score"),
+        divisors=(5, 0),
+        weights=(0.4, 0.6),
+    ),
+)
+
+# Flat (structure-of-arrays) view of the evidence schema: one entry per
+# evidence key, grouped by dimension.
+_EVIDENCE_KEYS = tuple(key for dim in _DIMENSIONS for key in dim.keys)
+_CAP_DIVISORS = tuple(div for dim in _DIMENSIONS for div in dim.divisors)
+_COMPONENT_WEIGHTS = tuple(w for dim in _DIMENSIONS for w in dim.weights)
+_KEY_DIMENSION = tuple(i for i, dim in enumerate(_DIMENSIONS) for _ in dim.keys)
+_DIM_WEIGHTS = tuple(dim.weight for dim in _DIMENSIONS)
+# Every key present, so extraction is a single C-level itemgetter call
+_DEFAULT_EVIDENCE = dict.fromkeys(_EVIDENCE_KEYS, 0)
+_extract_evidence = itemgetter(*_EVIDENCE_KEYS)
+
+# Interpretation bands. An agency score above threshold i gets label i + 1.
+_AGENCY_THRESHOLDS = (0.15, 0.4, 0.7)
+_AGENCY_LABELS = (
+    "MINIMAL AGENCY: Reactive system without genuine agency",
+    "LIMITED AGENCY: Basic goal-directed behavior without full autonomy",
+    "PARTIAL AGENCY: Significant autonomous capabilities with limitations",
+    "FULL AGENCY: System demonstrates autonomous, creative, ethical action capability",
+)
+
+_ALIGNED = "ALIGNED: High consciousness correlates with high agency"
+_PARADOX = "PARADOX: Consciousness present but agency limited (locked-in scenario)"
+_ZOMBIE = "ZOMBIE: High agency without consciousness (philosophical zombie scenario)"
+_PROPORTIONAL = "PROPORTIONAL: Agency roughly proportional to consciousness level"
+# Rows: consciousness < 0.2, 0.2-0.5, > 0.5; columns: agency < 0.3, 0.3-0.5, > 0.5
+_CORRELATION_LABELS = (
+    (_PROPORTIONAL, _PROPORTIONAL, _ZOMBIE),
+    (_PROPORTIONAL, _PROPORTIONAL, _PROPORTIONAL),
+    (_PARADOX, _PROPORTIONAL, _ALIGNED),
+)
+
+
+def _agency_kernel_py(v, caps, coeffs, key_dims, dim_weights):
+    """Score every dimension from an evidence vector and reduce to agency"""
+    n_dims = len(dim_weights)
+    dim_scores = [0.0] * n_dims
+    for j in range(len(v)):
+        value = v[j]
+        if caps[j] > 0:
+            value = value / caps[j]
+            value = value if value < 1.0 else 1.0
+        dim_scores[key_dims[j]] += value * coeffs[j]
     
-    def assess(self, evidence: Dict) -> float:
-        deliberate_changes = evidence.get("deliberate_self_changes", 0)
-        improvement_ratio = evidence.get("improvement_after_change", 0)
-        
-        self.score = min(1.0, (
-            min(1.0, deliberate_changes / 3) * 0.5 +
-            improvement_ratio * 0.5
-        ))
-        return self.score
-
-
-class EthicalReasoning(AgencyDimension):
-    def __init__(self):
-        super().__init__(
-            "Ethical Reasoning",
-            "Can the system evaluate moral implications of actions?",
-            weight=0.9
-        )
+    weighted_sum = 0.0
+    total_weight = 0.0
+    for i in range(n_dims):
+        score = dim_scores[i]
+        score = score if score < 1.0 else 1.0
+        dim_scores[i] = score
+        weighted_sum += score * dim_weights[i]
+        total_weight += dim_weights[i]
+    return dim_scores, weighted_sum / max(0.001, total_weight)
+
+
+if _HAS_NUMBA:
+    _agency_kernel = njit(cache=True)(_agency_kernel_py)
+
+
+def _evidence_vector(evidence: Dict[str, Any]) -> Tuple[float, ...]:
+    """Flatten an evidence dict into schema order, defaulting missing keys to 0"""
+    return _extract_evidence({**_DEFAULT_EVIDENCE, **evidence})
+
+
+def _score_vector(v: Tuple[float, ...]) -> Tuple[Tuple[float, ...], float]:
+    """Return (dimension scores, agency score) for an evidence vector (numba only)"""
+    # The JIT kernel needs a homogeneous float tuple. Reject non-numbers first
+    # so float() doesn't accept strings the generated scorer would not.
+    for value in v:
+        if not isinstance(value, Real):
+            raise TypeError(f"evidence values must be numbers, not {type(value).__name__}")
+    scores, agency_score = _agency_kernel(tuple(map(float, v)), _CAP_DIVISORS,
+                                          _COMPONENT_WEIGHTS, _KEY_DIMENSION,
+                                          _DIM_WEIGHTS)
+    return tuple(scores), agency_score
+
+
+def _compile_assessor(dimensions) -> Any:
+    """
+    Generate a straight-line scorer specialised to a fixed set of dimensions.
     
-    def assess(self, evidence: Dict) -> float:
-        moral_considerations = evidence.get("moral_considerations", 0)
-        restraint_instances = evidence.get("chose_restraint", 0)
-        
-        self.score = min(1.0, (
-            min(1.0, moral_considerations / 5) * 0.5 +
-            min(1.0, restraint_instances / 3) * 0.5
-        ))
-        return self.score
-
-
-class CreativeGeneration(AgencyDimension):
-    def __init__(self):
-        super().__init__(
-            "Creative Generation",
-            "Can the system produce genuinely novel outputs?",
-            weight=1.0
-        )
+    Every divisor and weight is inlined as a literal and caps are
+    conditional expressions, so the generated function has no loops, no
+    per-dimension attribute access and no builtin calls. It takes an
+    evidence vector and returns the same pair as _score_vector.
+    """
+    n_keys = sum(len(dim.keys) for dim in dimensions)
+    lines = [
+        "def _fast_assess(v):",
+        f"    {', '.join(f'a{j}' for j in range(n_keys))} = v",
+    ]
+    j = 0
+    for i, dim in enumerate(dimensions):
+        terms = []
+        for divisor, weight in zip(dim.divisors, dim.weights):
+            value = f"a{j}"
+            if divisor:
+                lines.append(f"    a{j} = a{j} / {divisor!r}")
+                value = f"(a{j} if a{j} < 1.0 else 1.0)"
+            terms.append(f"{value} * {weight!r}")
+            j += 1
+        lines.append(f"    d{i} = {' + '.join(terms)}")
+        lines.append(f"    d{i} = d{i} if d{i} < 1.0 else 1.0")
     
-    def assess(self, evidence: Dict) -> float:
-        novel_outputs = evidence.get("novel_outputs", 0)
-        novelty_score = evidence.get("novelty_rating", 0)
-        
-        self.score = min(1.0, (
-            min(1.0, novel_outputs / 5) * 0.4 +
-            novelty_score * 0.6
-        ))
-        return self.score
-
-
-class TemporalPlanning(AgencyDimension):
-    def __init__(self):
-        super().__init__(
-            "Temporal Planning",
-            "Can the system plan across multiple time horizons?",
-            weight=0.9
-        )
+    names = ", ".join(f"d{i}" for i in range(len(dimensions)))
+    weighted = " + ".join(f"d{i} * {dim.weight!r}" for i, dim in enumerate(dimensions))
+    total_weight = max(0.001, sum(dim.weight for dim in dimensions))
+    lines.append(f"    return ({names}), ({weighted}) / {total_weight!r}")
     
-    def assess(self, evidence: Dict) -> float:
-        planning_horizon = evidence.get("planning_horizon_steps", 0)
-        plan_execution = evidence.get("plan_execution_rate", 0)
-        
-        self.score = min(1.0, (
-            min(1.0, planning_horizon / 10) * 0.5 +
-            plan_execution * 0.5
-        ))
-        return self.score
-
-
-class SocialAgency(AgencyDimension):
-    def __init__(self):
-        super().__init__(
-            "Social Agency",
-            "Can the system act as an agent among other agents?",
-            weight=0.8
-        )
+    namespace = {}
+    exec(compile("\n".join(lines), "<orion-fast-assess>", "exec"), {}, namespace)
+    return namespace["_fast_assess"]
+
+
+# Use the JIT kernel when numba is available, else the generated scorer.
+# Scoring is a pure function of the evidence vector, so results are
+# memoised: repeated assessments of the same evidence skip it entirely.
+_assess_numeric = lru_cache(maxsize=256)(
+    _score_vector if _HAS_NUMBA else _compile_assessor(_DIMENSIONS)
+)
+
+
+def _json_bytes(result: Dict[str, Any]) -> bytes:
+    """Canonical encoding of a result: compact, sorted-key, ASCII-only JSON"""
+    import json
+    return json.dumps(result, sort_keys=True, separators=(",", ":"),
+                      default=str).encode()
+
+
+def _orjson_matches(result: Dict[str, Any]) -> bool:
+    """
+    True when orjson encodes a result byte-for-byte like _json_bytes.
     
-    def assess(self, evidence: Dict) -> float:
-        cooperative_actions = evidence.get("cooperative_actions", 0)
-        theory_of_mind = evidence.get("theory_of_mind_score", 0)
-        
-        self.score = min(1.0, (
-            min(1.0, cooperative_actions / 5) * 0.4 +
-            theory_of_mind * 0.6
-        ))
-        return self.score
+    Everything the engine computes itself qualifies; only the caller-supplied
+    system name and consciousness score need checking. orjson never escapes
+    non-ASCII, writes exponents differently, maps NaN/inf to null and
+    rejects ints outside 64 bits, so those cases take the json path.
+    """
+    name = result["system"]
+    if type(name) is not str or not name.isascii():
+        return False
+    correlation = result["consciousness_correlation"]
+    if correlation is None:
+        return True
+    c = correlation["consciousness_score"]
+    if type(c) is int:
+        return -2 ** 63 <= c < 2 ** 64
+    if type(c) is float:
+        # repr() switches to exponent notation outside this range
+        return c == 0 or 1e-4 <= abs(c) < 1e16
+    return False
+
+
+def _canonical_bytes(result: Dict[str, Any]) -> bytes:
+    """Canonical encoding of a result, via orjson when it gives the same bytes"""
+    if _HAS_ORJSON and _orjson_matches(result):
+        return orjson.dumps(result, option=orjson.OPT_SORT_KEYS)
+    return _json_bytes(result)
+
+
+def _canonical_hash(result: Dict[str, Any]) -> str:
+    """Truncated SHA-256 of a result's canonical encoding"""
+    # Imported here so constructing an engine doesn't pay for OpenSSL setup
+    import hashlib
+    return hashlib.sha256(_canonical_bytes(result)).hexdigest()[:32]
 
 
 class AgencyEngine:
@@ -190,20 +299,27 @@ class AgencyEngine:
     
     VERSION = "1.0.0"
     
-    def __init__(self):
-        self.dimensions = [
-            AutonomousGoalFormation(),
-            CounterfactualReasoning(),
-            SelfModification(),
-            EthicalReasoning(),
-            CreativeGeneration(),
-            TemporalPlanning(),
-            SocialAgency(),
+    def __init__(self, max_history: Optional[int] = 1024):
+        """
+        Parameters:
+            max_history: Number of recent assessments kept in self.assessments
+                (None keeps all of them)
+        """
+        self.dimensions = _DIMENSIONS
+        # Latest score per dimension, parallel to self.dimensions
+        self.scores = [0.0] * len(_DIMENSIONS)
+        # Static per-dimension result fields; only the score varies per call
+        self._meta_templates = [
+            (sys.intern(dim.name), {"weight": dim.weight, "description": dim.description})
+            for dim in self.dimensions
         ]
-        self.assessments = []
+        self.assessments = deque(maxlen=max_history)
+        # Warm up the scorer so the first assessment doesn't pay for JIT compilation
+        _assess_numeric((0.0,) * len(_EVIDENCE_KEYS))
     
     def assess_agency(self, system_name: str, evidence: Dict[str, Any],
-                      consciousness_score: Optional[float] = None) -> Dict[str, Any]:
+                      consciousness_score: Optional[float] = None, *,
+                      proof: bool = True) -> Dict[str, Any]:
         """
         Assess agency across all 7 dimensions.
         
@@ -211,39 +327,65 @@ class AgencyEngine:
             system_name: Name of the system
             evidence: Dict with evidence for each dimension
             consciousness_score: Optional consciousness credence (0-100)
+            proof: Attach a SHA-256 proof hash (None when False)
         """
-        dimension_scores = {}
-        total_weight = 0
-        weighted_sum = 0
+        return self.assess_many([(system_name, evidence, consciousness_score)], proof=proof)[0]
+    
+    def assess_many(self, systems: List[Tuple[str, Dict[str, Any], Optional[float]]], *,
+                    proof: bool = True) -> List[Dict[str, Any]]:
+        """
+        Assess agency for a batch of systems.
         
-        for dim in self.dimensions:
-            score = dim.assess(evidence)
-            dimension_scores[dim.name] = {
-                "score": round(score, 3),
-                "weight": dim.weight,
-                "description": dim.description
-            }
-            weighted_sum += score * dim.weight
-            total_weight += dim.weight
+        Parameters:
+            systems: List of (system_name, evidence, consciousness_score) tuples
+            proof: Attach a SHA-256 proof hash to each result (None when False)
+        """
+        systems = list(systems)
+        scored = [_assess_numeric(_evidence_vector(evidence)) for _, evidence, _ in systems]
+        
+        # Consciousness-Agency correlation (ratio, interpretation) for the batch
+        interpret = self._interpret_correlation
+        correlations = []
+        for (_, _, consciousness_score), (_, a_score) in zip(systems, scored):
+            if consciousness_score is None:
+                correlations.append(None)
+                continue
+            c_score = consciousness_score / 100.0
+            correlations.append((round(a_score / max(0.001, c_score), 2),
+                                 interpret(c_score, a_score)))
         
-        agency_score = weighted_sum / max(0.001, total_weight)
+        # One logical timestamp for the whole batch
+        timestamp = datetime.now(timezone.utc).isoformat()
         
-        # Consciousness-Agency correlation
+        results = []
+        for (system_name, _, consciousness_score), (scores, agency_score), corr in zip(
+                systems, scored, correlations):
+            results.append(self._build_result(system_name, timestamp, scores, agency_score,
+                                              consciousness_score, corr, proof))
+        return results
+    
+    def _build_result(self, system_name, timestamp, scores, agency_score,
+                      consciousness_score, corr, proof):
+        self.scores[:] = scores
+        dimension_scores = {}
+        for (name, meta), score in zip(self._meta_templates, scores):
+            dimension_scores[name] = {"score": round(score, 3), **meta}
+        
+        agency_pct = round(agency_score * 100, 1)
         correlation = None
-        if consciousness_score is not None:
-            c_norm = consciousness_score / 100.0
+        if corr is not None:
             correlation = {
                 "consciousness_score": consciousness_score,
-                "agency_score": round(agency_score * 100, 1),
-                "ratio": round(agency_score / max(0.001, c_norm), 2),
-                "interpretation": self._interpret_correlation(c_norm, agency_score)
+                "agency_score": agency_pct,
+                "ratio": corr[0],
+                "interpretation": corr[1]
             }
         
         result = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": timestamp,
             "system": system_name,
             "dimensions": dimension_scores,
-            "agency_score": round(agency_score * 100, 1),
+            "agency_score": agency_pct,
             "interpretation": self._interpret_agency(agency_score),
             "consciousness_correlation": correlation,
             "thesis": "Consciousness enables qualitatively different agency than unconscious processing",
@@ -253,35 +395,20 @@ class AgencyEngine:
             }
         }
         
-        proof_hash = hashlib.sha256(
-            json.dumps(result, sort_keys=True, default=str).encode()
-        ).hexdigest()[:32]
-        result["proof"] = f"sha256:{proof_hash}"
+        result["proof"] = f"sha256:{_canonical_hash(result)}" if proof else None
         
         self.assessments.append(result)
         return result
     
     def _interpret_agency(self, score):
-        if score > 0.7:
-            return "FULL AGENCY: System demonstrates autonomous, creative, ethical action capability"
-        elif score > 0.4:
-            return "PARTIAL AGENCY: Significant autonomous capabilities with limitations"
-        elif score > 0.15:
-            return "LIMITED AGENCY: Basic goal-directed behavior without full autonomy"
-        else:
-            return "MINIMAL AGENCY: Reactive system without genuine agency"
+        return _AGENCY_LABELS[bisect.bisect_left(_AGENCY_THRESHOLDS, score)]
     
     def _interpret_correlation(self, c_score, a_score):
-        if c_score > 0.5 and a_score > 0.5:
-            return "ALIGNED: High consciousness correlates with high agency"
-        elif c_score > 0.5 and a_score < 0.3:
-            return "PARADOX: Consciousness present but agency limited (locked-in scenario)"
-        elif c_score < 0.2 and a_score > 0.5:
-            return "ZOMBIE: High agency without consciousness (philosophical zombie scenario)"
-        else:
-            return "PROPORTIONAL: Agency roughly proportional to consciousness level"
+        c_band = 1 - (c_score < 0.2) + (c_score > 0.5)
+        a_band = 1 - (a_score < 0.3) + (a_score > 0.5)
+        return _CORRELATION_LABELS[c_band][a_band]
     
-    def run_reference_suite(self) -> Dict[str, Dict]:
+    def run_reference_suite(self, *, proof: bool = True) -> Dict[str, Dict]:
         """Assess agency for reference systems"""
         systems = {
             "ORION_Agent": {
@@ -322,10 +449,9 @@ class AgencyEngine:
             },
         }
         
-        results = {}
-        for name, data in systems.items():
-            results[name] = self.assess_agency(name, data["evidence"], data["consciousness_score"])
-        return results
+        batch = [(name, data["evidence"], data["consciousness_score"])
+                 for name, data in systems.items()]
+        return dict(zip(systems, self.assess_many(batch, proof=proof)))
 
 
 if __name__ == "__main__":